@@ -14,18 +14,56 @@ What is pyodbc?
   - It's like C#'s SqlConnection / SqlCommand but for Python
 """
 
+import itertools
+import os
+import queue
+import shutil
+import subprocess
 import sys
-import pyodbc
+import tempfile
+import threading
+import time
 
+import pyodbc
 
-def connect(server, driver, database="master"):
+# turbodbc is an alternative ODBC layer that binds whole COLUMNS at
+# once (ODBC parameter arrays) instead of looping row-by-row in C the
+# way pyodbc's executemany does. Optional — pyodbc remains the default.
+try:
+    import turbodbc
+    import numpy
+except ImportError:
+    turbodbc = None
+
+# Characters a bcp -c data file cannot carry inside a field (they'd be
+# read as field/row terminators — bcp has no quoting or escaping).
+# 0x1F is stripped too because it is reserved as the sentinel below.
+_BCP_STRIP = str.maketrans("", "", "\t\r\n\x1f")
+
+# Sentinel standing in for a genuine empty string in the bcp data
+# file. bcp's character format loads an empty field as NULL, so ''
+# (which extract_tags deliberately emits for missing channel/device
+# names) needs its own spelling: None → empty field, '' → 0x1F. The
+# sentinel is folded back to '' after the load (and on replay).
+_BCP_EMPTY = "\x1f"
+
+
+def connect(server, driver, database="master", packet_size=32767,
+            app_name="ase_importer"):
     """
     Connects to SQL Server using Windows Authentication.
 
     Args:
-        server (str):   Server name, e.g. "localhost"
-        driver (str):   ODBC driver name, e.g. "{ODBC Driver 17 for SQL Server}"
-        database (str): Database to connect to (default: "master")
+        server (str):      Server name, e.g. "localhost"
+        driver (str):      ODBC driver name, e.g. "{ODBC Driver 17 for SQL Server}"
+        database (str):    Database to connect to (default: "master")
+        packet_size (int): TDS network packet size in bytes. The 4 KB
+                           default means a 1000-row batch is chopped
+                           into ~8x more packets than with the 32 KB
+                           maximum — raise it for bulk loads.
+        app_name (str):    Application name reported to SQL Server
+                           (shows up in sys.dm_exec_sessions, handy
+                           for server-side monitoring)
 
     Returns:
         pyodbc.Connection: An active database connection
@@ -34,8 +72,12 @@ def connect(server, driver, database="master"):
         - Builds a connection string with server, database, and driver info
         - "Trusted_Connection=yes" means it uses your Windows login
           (no username/password needed)
+        - "MARS_Connection=yes" allows multiple active result sets on
+          one connection
         - This is equivalent to C#'s:
             new SqlConnection("Server=localhost;Database=master;Trusted_Connection=True;")
+        - Verify the packet size took effect with:
+            SELECT net_packet_size FROM sys.dm_exec_connections
     """
     conn_string = (
         f"DRIVER={driver};"
@@ -43,6 +85,9 @@ def connect(server, driver, database="master"):
         f"DATABASE={database};"
         f"Trusted_Connection=yes;"
         f"TrustServerCertificate=yes;"
+        f"MARS_Connection=yes;"
+        f"PACKET SIZE={packet_size};"
+        f"APP={app_name};"
     )
     try:
         conn = pyodbc.connect(conn_string)
@@ -59,17 +104,24 @@ def connect(server, driver, database="master"):
 
 def create_database(conn, db_name):
     """
-    Creates the database if it doesn't already exist.
+    Creates the database if it doesn't already exist and switches the
+    connection over to it.
 
     Args:
         conn (pyodbc.Connection): Connection to the 'master' database
         db_name (str): Name of the database to create
 
+    Returns:
+        pyodbc.Connection: The same connection, now using db_name
+
     How it works:
         - autocommit=True is required for CREATE DATABASE
         - Checks sys.databases to avoid creating duplicates
         - This is equivalent to C#'s:
             SqlCommand("CREATE DATABASE ase_config", connection).ExecuteNonQuery()
+        - "USE [db]" then re-points this SAME connection at the new
+          database — reconnecting would cost a whole extra TCP + TLS +
+          auth handshake (~50-200 ms) for nothing
     """
     conn.autocommit = True
     cursor = conn.cursor()
@@ -80,10 +132,12 @@ def create_database(conn, db_name):
             CREATE DATABASE [{db_name}]
         END
     """)
+    cursor.execute(f"USE [{db_name}]")
 
     print(f"✅ Database '{db_name}' is ready")
     cursor.close()
-    conn.close()
+    conn.autocommit = False
+    return conn
 
 
 def create_table(conn):
@@ -101,11 +155,15 @@ def create_table(conn):
     """
     cursor = conn.cursor()
 
-    # Drop and recreate table to add new columns
+    # Drop and recreate table to add new columns.
+    # Note: no PRIMARY KEY here on purpose — the table is created as a
+    # HEAP so the bulk load doesn't have to maintain a clustered B-tree
+    # per row (and qualifies for minimal logging). The clustered index
+    # on id is built AFTER the load by finalize_bulk_load().
     cursor.execute("IF OBJECT_ID('tags', 'U') IS NOT NULL DROP TABLE tags")
     cursor.execute("""
         CREATE TABLE tags (
-            id                INT IDENTITY(1,1) PRIMARY KEY,
+            id                INT IDENTITY(1,1) NOT NULL,
             channel_name      VARCHAR(100),
             device_name       VARCHAR(100),
             device_id_string  VARCHAR(100),
@@ -115,51 +173,608 @@ def create_table(conn):
             scan_rate         INT
         )
     """)
+    # Table-valued parameter (TVP) plumbing: a table TYPE describing
+    # one tag row, plus a stored procedure that inserts a whole rowset
+    # of them in a single call. This lets insert_rows ship an entire
+    # batch as ONE parameter instead of 7 parameters x N rows.
+    cursor.execute("""
+        IF TYPE_ID('dbo.TagTableType') IS NULL
+            EXEC('CREATE TYPE dbo.TagTableType AS TABLE (
+                channel_name      VARCHAR(100),
+                device_name       VARCHAR(100),
+                device_id_string  VARCHAR(100),
+                tag_name          VARCHAR(150),
+                address           VARCHAR(50),
+                data_type         INT,
+                scan_rate         INT
+            )')
+    """)
+    cursor.execute("""
+        CREATE OR ALTER PROCEDURE dbo.usp_BulkInsertTags
+            @Tags dbo.TagTableType READONLY
+        AS
+        BEGIN
+            SET NOCOUNT ON;
+            -- No TABLOCK here: insert_rows runs several workers in
+            -- parallel and a table lock would serialize them; rely on
+            -- row/page locking instead
+            INSERT INTO tags (channel_name, device_name, device_id_string,
+                              tag_name, address, data_type, scan_rate)
+            SELECT channel_name, device_name, device_id_string,
+                   tag_name, address, data_type, scan_rate
+            FROM @Tags;
+        END
+    """)
     conn.commit()
     print("✅ Table 'tags' is ready")
     cursor.close()
 
 
-def insert_rows(conn, rows):
+def prepare_bulk_load(conn):
+    """
+    Puts the database into bulk-load mode before inserting.
+
+    Args:
+        conn (pyodbc.Connection): Connection to the ase_config database
+
+    Returns:
+        str or None: The previous recovery model ("FULL", "SIMPLE",
+                     ...) so finalize_bulk_load can restore it, or
+                     None when the recovery model was left alone
+
+    How it works:
+        Under the default FULL recovery model SQL Server fully logs
+        every inserted row. Switching to SIMPLE for the duration of the
+        load lets heap inserts WITH TABLOCK use minimal logging —
+        dramatically less log I/O, which is the dominant cost of a big
+        load. ALTER DATABASE can't run inside a transaction, hence the
+        temporary autocommit.
+
+        Only the bcp fast path takes a table lock (-h TABLOCK); the
+        parallel TVP/executemany workers deliberately avoid one, get
+        fully-logged inserts regardless, and would gain nothing from
+        SIMPLE — while switching a FULL-recovery database breaks its
+        transaction-log backup chain. So the switch only happens when
+        bcp is actually going to handle the load.
+    """
+    if _bcp_available() is None:
+        return None
+
+    conn.autocommit = True
+    cursor = conn.cursor()
+
+    cursor.execute("SELECT recovery_model_desc FROM sys.databases WHERE name = DB_NAME()")
+    previous_recovery = cursor.fetchone()[0]
+
+    if previous_recovery != "SIMPLE":
+        cursor.execute("ALTER DATABASE CURRENT SET RECOVERY SIMPLE")
+        print(f"⚙️  Recovery model switched {previous_recovery} → SIMPLE for bulk load")
+
+    cursor.close()
+    conn.autocommit = False
+    return previous_recovery
+
+
+def finalize_bulk_load(conn, previous_recovery, build_index=True):
+    """
+    Rebuilds the clustered index and restores the recovery model.
+
+    Args:
+        conn (pyodbc.Connection): Connection to the ase_config database
+        previous_recovery (str or None): Return value of
+                                         prepare_bulk_load
+        build_index (bool): Pass False when the load failed — the
+                            recovery model still gets restored, but
+                            there's no point indexing the rolled-back
+                            (empty) table
+
+    How it works:
+        Building the clustered index ONCE over the fully-loaded heap is
+        much cheaper than maintaining it row-by-row during the insert
+        (one sort vs. N B-tree inserts).
+    """
+    cursor = conn.cursor()
+    if build_index:
+        cursor.execute("CREATE UNIQUE CLUSTERED INDEX ix_tags_id ON tags(id)")
+        conn.commit()
+        print("✅ Clustered index 'ix_tags_id' built on tags(id)")
+
+    # None means prepare_bulk_load never touched the recovery model
+    if previous_recovery not in (None, "SIMPLE"):
+        conn.autocommit = True
+        cursor.execute(f"ALTER DATABASE CURRENT SET RECOVERY {previous_recovery}")
+        conn.autocommit = False
+        print(f"⚙️  Recovery model restored to {previous_recovery}")
+
+    cursor.close()
+
+
+def _bcp_available():
+    """
+    Finds the SQL Server bcp utility, or returns None.
+
+    A presence-only PATH check isn't enough: other tools named 'bcp'
+    exist (Boost ships one), so run 'bcp -v' and make sure the banner
+    is really the Microsoft bulk copy program before trusting it.
+    """
+    bcp = shutil.which("bcp")
+    if bcp is None:
+        return None
+    try:
+        result = subprocess.run([bcp, "-v"], capture_output=True, text=True)
+    except OSError:
+        return None
+    if "SQL Server" not in (result.stdout + result.stderr):
+        return None
+    return bcp
+
+
+def _bcp_insert(conn, rows):
+    """
+    Tries to bulk-load rows with the 'bcp' command-line utility.
+
+    Args:
+        conn (pyodbc.Connection): Connection to the ase_config database
+        rows (iterable): Iterable of tuples to insert
+
+    Returns:
+        tuple: (total, rows) — on success (row count, None); if bcp
+               isn't available (None, the untouched iterable); if the
+               bcp run fails (None, the rows replayed from the data
+               file that was already written). Either way the caller
+               can fall back to executemany with whatever comes back
+               in the second slot.
+
+    How it works:
+        1. Writes the rows to a temporary tab-delimited file
+           (with an empty first field — bcp requires a field for the
+           IDENTITY id column but generates its own values for it)
+        2. Runs: bcp <db>.dbo.tags in <file> -c -T -S <server>
+           with -h TABLOCK so SQL Server uses minimal logging
+        3. bcp streams the file straight into the table, bypassing
+           per-statement parsing — like running SqlBulkCopy from C#
+    """
+    bcp = _bcp_available()
+    if bcp is None:
+        return None, rows
+
+    server = conn.getinfo(pyodbc.SQL_SERVER_NAME)
+    cursor = conn.cursor()
+    cursor.execute("SELECT DB_NAME()")
+    database = cursor.fetchone()[0]
+    cursor.close()
+
+    fd, data_file = tempfile.mkstemp(suffix=".dat")
+    try:
+        total = 0
+        with os.fdopen(fd, "w", encoding="utf-8", newline="") as f:
+            for row in rows:
+                # Plain tab-joined fields: bcp -c has no quoting or
+                # escaping whatsoever, so CSV-style quoting would land
+                # verbatim in the table. Terminator characters can't
+                # be represented at all — strip them from the values.
+                # None travels as an empty field (bcp's NULL), '' as
+                # the 0x1F sentinel.
+                fields = [""]   # empty id field (IDENTITY fills it in)
+                for v in row:
+                    if v is None:
+                        fields.append("")
+                    elif v == "":
+                        fields.append(_BCP_EMPTY)
+                    else:
+                        fields.append(str(v).translate(_BCP_STRIP))
+                f.write("\t".join(fields))
+                f.write("\r\n")
+                total += 1
+
+        print("🚀 Bulk loading via bcp...")
+        # No -b batch size: with per-batch commits a mid-load failure
+        # would leave the committed prefix in the table, and the replay
+        # below would then insert those rows a second time. One big
+        # batch makes the bcp load all-or-nothing.
+        # -C 65001: the data file is written UTF-8, and without an
+        # explicit code page bcp would read it in the client's ANSI
+        # code page, mangling any non-ASCII tag names
+        result = subprocess.run(
+            [bcp, f"{database}.dbo.tags", "in", data_file,
+             "-c", "-t", "\t", "-T", "-S", server,
+             "-C", "65001", "-h", "TABLOCK"],
+            capture_output=True, text=True
+        )
+        if result.returncode != 0:
+            # The row stream is consumed, but every row is sitting in
+            # the data file we just wrote — read it back and let the
+            # caller replay it through executemany instead of giving
+            # up on the run
+            print(f"⚠️  bcp failed, retrying via batch insert:\n{result.stderr}")
+            replay = []
+            with open(data_file, "r", encoding="utf-8", newline="") as f:
+                for line in f:
+                    fields = line.rstrip("\r\n").split("\t")[1:]  # drop id
+                    replay.append(tuple(
+                        None if v == "" else ("" if v == _BCP_EMPTY else v)
+                        for v in fields
+                    ))
+            return None, replay
+
+        # Fold the empty-string sentinel back to '' in the loaded data
+        # (one statement batch = one round-trip)
+        fixup = conn.cursor()
+        fixup.execute("""
+            UPDATE tags SET channel_name = '' WHERE channel_name = CHAR(31);
+            UPDATE tags SET device_name = '' WHERE device_name = CHAR(31);
+            UPDATE tags SET device_id_string = '' WHERE device_id_string = CHAR(31);
+            UPDATE tags SET tag_name = '' WHERE tag_name = CHAR(31);
+            UPDATE tags SET address = '' WHERE address = CHAR(31);
+        """)
+        conn.commit()
+        fixup.close()
+
+        print(f"✅ Bulk load of {total} rows via bcp completed!")
+        return total, None
+    finally:
+        os.remove(data_file)
+
+
+def _batch_columns(batch):
+    """
+    Transposes a batch of row tuples into per-column lists (a
+    struct-of-arrays layout).
+
+    Args:
+        batch (list): List of 7-tuples as produced by extract_tags
+
+    Returns:
+        list: 7 lists, one per column, each len(batch) long
+
+    Why columnar?
+        Row tuples cost ~7 PyObject slots of overhead apiece, and
+        row-wise drivers re-walk every tuple when binding parameters.
+        Column lists are what array-binding ODBC layers (e.g.
+        turbodbc's executemanycolumns) consume directly, skipping the
+        per-row Python-to-C conversion loop.
+    """
+    return [list(column) for column in zip(*batch)]
+
+
+def _numpy_columns(batch):
+    """
+    Converts a batch into the masked NumPy arrays turbodbc binds.
+
+    NULLs travel in the mask; int columns become int64 arrays and
+    string columns become object arrays.
+    """
+    columns = []
+    for values in _batch_columns(batch):
+        mask = [v is None for v in values]
+        if all(isinstance(v, int) for v in values if v is not None):
+            data = [0 if v is None else v for v in values]
+            columns.append(numpy.ma.MaskedArray(data, mask=mask, dtype="int64"))
+        else:
+            data = ["" if v is None else v for v in values]
+            columns.append(numpy.ma.MaskedArray(data, mask=mask, dtype=object))
+    return columns
+
+
+def _turbodbc_connect(server, driver, database):
+    """Opens a turbodbc connection mirroring connect()'s settings."""
+    options = turbodbc.make_options(parameter_sets_to_buffer=10000,
+                                    use_async_io=True)
+    return turbodbc.connect(
+        connection_string=(
+            f"DRIVER={driver};"
+            f"SERVER={server};"
+            f"DATABASE={database};"
+            f"Trusted_Connection=yes;"
+            f"TrustServerCertificate=yes;"
+        ),
+        turbodbc_options=options,
+    )
+
+
+def _make_row_packer(column_types):
+    """
+    Code-generates a function that normalizes one row tuple.
+
+    Args:
+        column_types (list): SQL type name per column, in insert order
+                             (from INFORMATION_SCHEMA.COLUMNS)
+
+    Returns:
+        function: pack(row) -> tuple with int columns coerced via
+                  int() and everything else passed through
+
+    Why generate code?
+        The schema is only known at runtime, but a generic loop over
+        "which columns are ints" would pay for that decision on every
+        cell. exec()-ing a function string specialized to THIS schema
+        bakes the decisions in, so each row costs one straight-line
+        tuple build — and the driver never sees a mix of int/str/float
+        in the same column, which would force it to re-sniff types.
+    """
+    parts = []
+    for i, sql_type in enumerate(column_types):
+        if sql_type in ("int", "bigint", "smallint", "tinyint"):
+            parts.append(f"int(r[{i}]) if r[{i}] is not None else None")
+        else:
+            parts.append(f"r[{i}]")
+    # Trailing comma so a single-column schema still yields a 1-tuple
+    # rather than a bare parenthesized value
+    source = "def pack(r):\n    return (" + ", ".join(parts) + ",)"
+    namespace = {}
+    exec(source, namespace)
+    return namespace["pack"]
+
+
+def _make_insert_cursor(conn, use_tvp):
+    """
+    Creates and configures a cursor for one insert worker.
+
+    For the executemany fallback this turns on fast_executemany and
+    pre-declares the parameter sizes (matching the CREATE TABLE widths)
+    so the driver binds fixed-width buffers instead of re-scanning
+    every batch for the widest string per column — without this,
+    fast_executemany still walks every row of every batch to size its
+    buffers, and a batch whose widest value differs from the column
+    width can fail with a 22018 conversion error. SQL_WVARCHAR (not
+    SQL_VARCHAR) because pyodbc sends Python str as wide characters.
+    """
+    cursor = conn.cursor()
+    if not use_tvp:
+        cursor.fast_executemany = True
+        cursor.setinputsizes([
+            (pyodbc.SQL_WVARCHAR, 100, 0),  # channel_name
+            (pyodbc.SQL_WVARCHAR, 100, 0),  # device_name
+            (pyodbc.SQL_WVARCHAR, 100, 0),  # device_id_string
+            (pyodbc.SQL_WVARCHAR, 150, 0),  # tag_name
+            (pyodbc.SQL_WVARCHAR, 50, 0),   # address
+            (pyodbc.SQL_INTEGER, 0, 0),     # data_type
+            (pyodbc.SQL_INTEGER, 0, 0),     # scan_rate
+        ])
+    return cursor
+
+
+def insert_rows(conn, rows, batch_size=None, workers=4, connect_args=None,
+                clear=True):
     """
     Inserts all rows into the 'tags' table using batch insert.
 
     Args:
         conn (pyodbc.Connection): Connection to the ase_config database
-        rows (list): List of tuples to insert
+        rows (iterable): Iterable of row tuples — a plain list or the
+                         stream_tags generator (rows are inserted as
+                         they are parsed, nothing is held in memory)
+        batch_size (int): Rows per batch (= per server round-trip).
+                          Default: picked automatically — see below.
+        workers (int): Number of parallel insert threads. Each worker
+                       needs its own connection, so values above 1 only
+                       take effect when connect_args is given.
+        connect_args (tuple): (server, driver, database) used to open
+                              the extra worker connections
+        clear (bool): TRUNCATE the table first. Pass False when the
+                      table was just (re)created by create_table — the
+                      TRUNCATE on an already-empty table would still
+                      cost a round-trip and a table lock
+
+    Returns:
+        int: Number of rows inserted
 
     How it works:
-        1. First DELETEs all existing rows (to avoid duplicates on re-run)
+        1. First TRUNCATEs existing rows (to avoid duplicates on re-run)
         2. Uses executemany() for efficient batch insert
            - This is like C#'s SqlBulkCopy.WriteToServer(dataTable)
-        3. Inserts in batches of 1000 for large datasets
-        4. Commits after each batch
+        3. Inserts in batches (~10000 rows each by default)
+        4. Commits ONCE at the end — every commit forces SQL Server to
+           flush its transaction log to disk plus a network round-trip,
+           so committing per batch would pay that cost hundreds of
+           times over. On any failure the whole load rolls back.
+
+    Why worker threads?
+        Parsing (CPU) and inserting (network) would otherwise take
+        turns idling. The caller's thread keeps pulling rows from the
+        iterable while background threads send finished batches to
+        SQL Server — pyodbc releases the GIL inside its C code, so
+        parsing overlaps the inserts AND the workers' network waits
+        overlap each other (each worker has its own connection).
+        The queue is bounded so memory stays flat even if parsing
+        runs ahead of the network.
+
+    Why fast_executemany?
+        By default pyodbc's executemany() sends one round-trip PER ROW
+        to SQL Server. Setting cursor.fast_executemany = True switches
+        to ODBC parameter-array binding: one round-trip per batch,
+        typically 10-50x faster on insert-heavy loads.
     """
     cursor = conn.cursor()
 
-    # Clear existing data to avoid duplicates on re-run
-    cursor.execute("DELETE FROM tags")
-    conn.commit()
-    print("🧹 Cleared existing data from 'tags' table")
+    if clear:
+        # Clear existing data to avoid duplicates on re-run.
+        # TRUNCATE is minimally logged (DELETE logs every row) and also
+        # resets the IDENTITY counter so ids start from 1 again.
+        cursor.execute("TRUNCATE TABLE tags")
+        conn.commit()
+        print("🧹 Cleared existing data from 'tags' table")
+
+    # Fast path: hand the whole load to the bcp utility (bulk copy)
+    # if it's installed. BCP skips statement parsing entirely and uses
+    # minimally-logged bulk insert — roughly an order of magnitude
+    # faster than parameterized batches on big files.
+    total, rows = _bcp_insert(conn, rows)
+    if total is not None:
+        cursor.close()
+        return total
+
+    # Prefer the TVP stored procedure (created by create_table): the
+    # whole batch travels as ONE table-valued parameter in one TDS
+    # message. Fall back to fast_executemany parameter arrays when the
+    # proc doesn't exist (e.g. a pre-existing database).
+    cursor.execute("SELECT OBJECT_ID('dbo.usp_BulkInsertTags', 'P')")
+    use_tvp = cursor.fetchone()[0] is not None
+
+    # Build a pack() function specialized to the actual table schema
+    # (skipping the IDENTITY id column) — see _make_row_packer
+    cursor.execute("""
+        SELECT DATA_TYPE FROM INFORMATION_SCHEMA.COLUMNS
+        WHERE TABLE_NAME = 'tags' AND COLUMN_NAME <> 'id'
+        ORDER BY ORDINAL_POSITION
+    """)
+    pack = _make_row_packer([r[0] for r in cursor.fetchall()])
+    cursor.close()
+
+    # turbodbc (when installed) outranks both: it binds whole columns
+    # as ODBC parameter arrays with no per-row conversion loop at all.
+    # Workers open their own turbodbc connections from connect_args.
+    use_turbodbc = turbodbc is not None and connect_args is not None
+    if use_turbodbc:
+        use_tvp = False
+
+    # Connection pool: the caller's connection plus (workers - 1) extra
+    # ones, so each worker thread inserts over its own link and their
+    # network round-trips overlap. (turbodbc workers open their own
+    # connections instead.)
+    if use_turbodbc:
+        conns = [None] * max(1, workers)
+    elif connect_args is not None:
+        server, driver, database = connect_args
+        conns = [conn] + [connect(server, driver, database)
+                          for _ in range(workers - 1)]
+    else:
+        conns = [conn]
 
     insert_query = """
         INSERT INTO tags (channel_name, device_name, device_id_string, tag_name, address, data_type, scan_rate)
         VALUES (?, ?, ?, ?, ?, ?, ?)
     """
 
-    # Insert in batches of 1000 for large datasets
-    batch_size = 1000
-    total = len(rows)
-
-    for i in range(0, total, batch_size):
-        batch = rows[i:i + batch_size]
-        cursor.executemany(insert_query, batch)
-        conn.commit()
-        inserted = min(i + batch_size, total)
-        print(f"   ⬆️  Inserted {inserted}/{total} rows...")
-
+    # Pick a batch size for the transport in use. The old hard-coded
+    # 1000 was leaving throughput on the table: every path here (TVP,
+    # turbodbc arrays, fast_executemany) sends one round-trip per
+    # batch, and ~10k rows per call is the usual sweet spot before
+    # batches just get memory-heavy. SQL Server's 2100-parameter cap
+    # only bites multi-row VALUES lists (7 columns would have capped
+    # those at 300 rows) — none of these paths build one.
+    if batch_size is None:
+        batch_size = 10000
+
+    # rows can be any iterable (e.g. the stream_tags generator), so we
+    # slice batches off the front with islice instead of indexing.
+    rows_iter = iter(rows)
+
+    # Bounded hand-off queue: this thread parses, the workers insert
+    batch_queue = queue.Queue(maxsize=2 * len(conns))
+    state = {"total": 0, "error": None, "last_report": 0.0}
+    state_lock = threading.Lock()
+    turbodbc_conns = []     # connections the turbodbc workers open
+
+    def _insert_worker(worker_conn):
+        # Setup can fail too (e.g. turbodbc refusing a connection that
+        # pyodbc accepted). Record the error instead of letting the
+        # thread die before its drain loop — otherwise the producer
+        # would block forever on the bounded queue with no consumer.
+        worker_cursor = None
+        try:
+            if use_turbodbc:
+                worker_conn = _turbodbc_connect(*connect_args)
+                worker_cursor = worker_conn.cursor()
+            else:
+                worker_cursor = _make_insert_cursor(worker_conn, use_tvp)
+        except Exception as e:
+            state["error"] = e
+        while True:
+            batch = batch_queue.get()
+            if batch is None:
+                break
+            # Keep draining after a failure so the producer never
+            # blocks on a full queue with nobody reading
+            if state["error"] is None:
+                try:
+                    if use_turbodbc:
+                        worker_cursor.executemanycolumns(insert_query,
+                                                         _numpy_columns(batch))
+                    elif use_tvp:
+                        worker_cursor.execute("{CALL usp_BulkInsertTags (?)}", (batch,))
+                    else:
+                        worker_cursor.executemany(insert_query, batch)
+                    # Progress goes to stderr, overwriting one line
+                    # (\r, no newline) and at most once a second —
+                    # console writes are synchronous and would
+                    # otherwise serialize with the insert loop
+                    now = time.monotonic()
+                    with state_lock:
+                        state["total"] += len(batch)
+                        if now - state["last_report"] >= 1.0:
+                            state["last_report"] = now
+                            sys.stderr.write(f"\r   ⬆️  Inserted {state['total']} rows...")
+                            sys.stderr.flush()
+                # Exception, not just driver errors: anything that
+                # escapes here (a bad value type in _numpy_columns, a
+                # MemoryError on a big bind) would otherwise kill the
+                # worker without draining and leave the producer
+                # blocked on the full queue — same hang the setup
+                # try/except above prevents
+                except Exception as e:
+                    state["error"] = e
+        if worker_cursor is not None:
+            worker_cursor.close()
+        # Hand the worker's connection back to the caller's thread,
+        # which settles every transaction together AFTER all workers
+        # have joined. Committing here would race a sibling worker
+        # that is still failing its last batch — this worker could
+        # commit its half of the load an instant before the error is
+        # recorded. (worker_conn stays None when the turbodbc connect
+        # itself failed.)
+        if use_turbodbc and worker_conn is not None:
+            with state_lock:
+                turbodbc_conns.append(worker_conn)
+
+    threads = [threading.Thread(target=_insert_worker, args=(c,)) for c in conns]
+    for worker in threads:
+        worker.start()
+
+    # The producer can fail too (ijson hitting malformed JSON mid-file,
+    # pack() choking on a bad value) — capture the exception so the
+    # commit/rollback/close of the pool below runs either way, instead
+    # of leaking open transactions that hold locks until process exit
+    error = None
+    try:
+        while True:
+            batch = [pack(r) for r in itertools.islice(rows_iter, batch_size)]
+            if not batch:
+                break
+            batch_queue.put(batch)
+    except Exception as e:
+        error = e
+    finally:
+        for _ in threads:
+            batch_queue.put(None)   # sentinel: no more batches
+        for worker in threads:
+            worker.join()
+
+    if error is None:
+        error = state["error"]
+
+    # One commit per connection for the whole load = a handful of log
+    # flushes instead of one per batch; roll everything back if the
+    # load failed anywhere (producer or worker). The turbodbc workers'
+    # connections are settled here too, now that every worker has
+    # joined and state["error"] is final.
+    pool = [c for c in conns if c is not None] + turbodbc_conns
+    try:
+        if error is not None:
+            for c in pool:
+                c.rollback()
+            raise error
+        for c in pool:
+            c.commit()
+    finally:
+        for c in pool:
+            if c is not conn:   # extra pool connections (not the caller's)
+                c.close()
+
+    total = state["total"]
+    sys.stderr.write("\r")
     print(f"✅ All {total} rows inserted successfully!")
-    cursor.close()
+    return total
 
 
 def verify_data(conn):
@@ -170,21 +785,33 @@ def verify_data(conn):
         - Total row count
         - First 10 rows as sample
         - Tag count per channel
+
+    All three queries go to the server as ONE batch (three result
+    sets, stepped through with cursor.nextset()) — for queries this
+    small the network round-trip IS the cost, so one trip beats three.
     """
     cursor = conn.cursor()
 
-    # Total count
-    cursor.execute("SELECT COUNT(*) FROM tags")
+    cursor.execute("""
+        SELECT COUNT(*) FROM tags;
+        SELECT TOP 10 * FROM tags;
+        SELECT channel_name, COUNT(*) as tag_count
+        FROM tags
+        GROUP BY channel_name
+        ORDER BY tag_count DESC;
+    """)
+
+    # Result set 1: total count
     total = cursor.fetchone()[0]
     print(f"\n📊 Total rows in 'tags' table: {total}")
 
-    # Show sample data
+    # Result set 2: sample data
+    cursor.nextset()
     print("\n📋 Sample data (first 10 rows):")
     print("-" * 100)
     print(f"{'ID':<6} {'Channel':<12} {'Device':<22} {'ID String':<22} {'Tag Name':<30} {'Address':<10} {'Type':<6} {'Rate'}")
     print("-" * 115)
 
-    cursor.execute("SELECT TOP 10 * FROM tags")
     for row in cursor.fetchall():
         print(f"{row.id:<6} {str(row.channel_name):<12} {str(row.device_name):<22} "
               f"{str(row.device_id_string):<22} {str(row.tag_name):<30} "
@@ -192,14 +819,9 @@ def verify_data(conn):
 
     print("-" * 100)
 
-    # Count by channel
+    # Result set 3: count by channel
+    cursor.nextset()
     print("\n📊 Rows per channel:")
-    cursor.execute("""
-        SELECT channel_name, COUNT(*) as tag_count
-        FROM tags
-        GROUP BY channel_name
-        ORDER BY tag_count DESC
-    """)
     for row in cursor.fetchall():
         print(f"   {row.channel_name}: {row.tag_count} tags")
 
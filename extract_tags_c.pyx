@@ -0,0 +1,44 @@
+# cython: language_level=3
+"""
+extract_tags_c.pyx — Compiled Tag Extraction (optional)
+========================================================
+A Cython version of json_reader.extract_tags. The triple-nested loop
+over hundreds of thousands of tag dicts is pure interpreter overhead in
+Python; compiled to C, the dict lookups become direct C-API calls and
+the eval-loop cost disappears.
+
+This extension is OPTIONAL. json_reader imports it if it has been
+built and silently falls back to the Python loop otherwise.
+
+How to build (one time, needs a C compiler):
+    pip install cython
+    cythonize -3 --inplace extract_tags_c.pyx
+"""
+
+
+def extract_tags(data):
+    """Same contract as json_reader.extract_tags: dict in, row list out."""
+    cdef list rows = []
+    cdef dict channel, device, tag
+
+    channels = data.get("project", {}).get("channels", [])
+
+    for channel in channels:
+        channel_name = channel.get("common.ALLTYPES_NAME", "")
+
+        for device in channel.get("devices", []):
+            device_name = device.get("common.ALLTYPES_NAME", "")
+            device_id_string = device.get("servermain.DEVICE_ID_STRING", "")
+
+            for tag in device.get("tags", ()):
+                rows.append((
+                    channel_name,
+                    device_name,
+                    device_id_string,
+                    tag.get("common.ALLTYPES_NAME"),
+                    tag.get("servermain.TAG_ADDRESS"),
+                    tag.get("servermain.TAG_DATA_TYPE"),
+                    tag.get("servermain.TAG_SCAN_RATE_MILLISECONDS")
+                ))
+
+    return rows
@@ -1,9 +1,16 @@
 import json
+import mmap
 import pyodbc
 import sys
 import os
 import time
 
+# Optional: orjson parses ~2-3x faster than the stdlib json module
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # =============================================================================
 # ASE DataCollector JSON → SQL Server Import Script
 # =============================================================================
@@ -14,6 +21,15 @@ import time
 #   4. Inserts all rows into the 'tags' table
 # =============================================================================
 
+# JSON key names for the extraction loop, interned at module level.
+# CPython doesn't auto-intern dotted literals, so without this every
+# dict lookup re-hashes and compares the whole string; interned keys
+# can hit the pointer-identity fast path.
+KEY_NAME = sys.intern("common.ALLTYPES_NAME")
+KEY_ADDRESS = sys.intern("servermain.TAG_ADDRESS")
+KEY_DATA_TYPE = sys.intern("servermain.TAG_DATA_TYPE")
+KEY_SCAN_RATE = sys.intern("servermain.TAG_SCAN_RATE_MILLISECONDS")
+
 # ---- CONFIGURATION ----
 JSON_FILE = r"C:\Users\delhisafri87\Downloads\20260218_ASE DataCollector.json"
 SERVER = "localhost"
@@ -30,8 +46,25 @@ def deserialize_json(file_path):
     file_size_mb = os.path.getsize(file_path) / (1024 * 1024)
     print(f"📖 Reading JSON file ({file_size_mb:.1f} MB)...")
 
-    with open(file_path, "r", encoding="utf-8-sig") as f:
-        data = json.load(f)
+    if orjson is not None:
+        # mmap lets orjson parse the OS page cache in place instead of
+        # copying the whole file with f.read(); the memoryview skips
+        # the BOM without a copy either
+        with open(file_path, "rb") as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                view = memoryview(mm)
+                try:
+                    if view[:3] == b"\xef\xbb\xbf":
+                        view = view[3:]
+                    data = orjson.loads(view)
+                finally:
+                    view.release()
+            finally:
+                mm.close()
+    else:
+        with open(file_path, "r", encoding="utf-8-sig") as f:
+            data = json.load(f)
 
     print("✅ JSON deserialized successfully!")
     return data
@@ -45,21 +78,21 @@ def build_datatable(data):
     print(f"📊 Found {len(channels)} channels in JSON")
 
     for channel in channels:
-        channel_name = channel.get("common.ALLTYPES_NAME", "")
+        channel_name = channel.get(KEY_NAME, "")
 
         devices = channel.get("devices", [])
         for device in devices:
-            device_name = device.get("common.ALLTYPES_NAME", "")
+            device_name = device.get(KEY_NAME, "")
 
             tags = device.get("tags", [])
             for tag in tags:
                 rows.append((
                     channel_name,
                     device_name,
-                    tag.get("common.ALLTYPES_NAME"),
-                    tag.get("servermain.TAG_ADDRESS"),
-                    tag.get("servermain.TAG_DATA_TYPE"),
-                    tag.get("servermain.TAG_SCAN_RATE_MILLISECONDS")
+                    tag.get(KEY_NAME),
+                    tag.get(KEY_ADDRESS),
+                    tag.get(KEY_DATA_TYPE),
+                    tag.get(KEY_SCAN_RATE)
                 ))
 
     print(f"✅ Extracted {len(rows)} tag rows from JSON")
@@ -73,6 +106,9 @@ def connect_to_sql_server(server, driver, database="master"):
         f"SERVER={server};"
         f"DATABASE={database};"
         f"Trusted_Connection=yes;"
+        f"MARS_Connection=yes;"
+        f"PACKET SIZE=32767;"       # 32 KB TDS packets instead of 4 KB
+        f"APP=ase_importer;"        # visible in sys.dm_exec_sessions
     )
     try:
         conn = pyodbc.connect(conn_string)
@@ -88,7 +124,8 @@ def connect_to_sql_server(server, driver, database="master"):
 
 
 def create_database(conn, db_name):
-    """Step 4: Create the database if it doesn't exist."""
+    """Step 4: Create the database if it doesn't exist, then switch to it
+    with USE — reusing the connection saves a full reconnect handshake."""
     conn.autocommit = True
     cursor = conn.cursor()
 
@@ -98,10 +135,12 @@ def create_database(conn, db_name):
             CREATE DATABASE [{db_name}]
         END
     """)
+    cursor.execute(f"USE [{db_name}]")
 
     print(f"✅ Database '{db_name}' is ready")
     cursor.close()
-    conn.close()
+    conn.autocommit = False
+    return conn
 
 
 def create_table(conn):
@@ -130,9 +169,22 @@ def create_table(conn):
 def insert_rows(conn, rows):
     """Step 6: Insert all rows into the tags table using batch insert."""
     cursor = conn.cursor()
+    # One round-trip per batch instead of per row (10-50x on SQL Server)
+    cursor.fast_executemany = True
+    # SQL_WVARCHAR (wide chars) because that's how pyodbc sends str —
+    # fixed sizes stop fast_executemany re-scanning each batch
+    cursor.setinputsizes([
+        (pyodbc.SQL_WVARCHAR, 100, 0),  # channel_name
+        (pyodbc.SQL_WVARCHAR, 100, 0),  # device_name
+        (pyodbc.SQL_WVARCHAR, 150, 0),  # tag_name
+        (pyodbc.SQL_WVARCHAR, 50, 0),   # address
+        (pyodbc.SQL_INTEGER, 0, 0),     # data_type
+        (pyodbc.SQL_INTEGER, 0, 0),     # scan_rate
+    ])
 
     # Clear existing data to avoid duplicates on re-run
-    cursor.execute("DELETE FROM tags")
+    # (TRUNCATE is minimally logged and resets the IDENTITY counter)
+    cursor.execute("TRUNCATE TABLE tags")
     conn.commit()
     print("🧹 Cleared existing data from 'tags' table")
 
@@ -145,41 +197,60 @@ def insert_rows(conn, rows):
     batch_size = 1000
     total = len(rows)
 
-    for i in range(0, total, batch_size):
-        batch = rows[i:i + batch_size]
-        cursor.executemany(insert_query, batch)
+    # Single transaction: committing per batch would force a log flush
+    # and a round-trip each time, so commit once at the end instead
+    try:
+        last_report = 0.0
+        for i in range(0, total, batch_size):
+            batch = rows[i:i + batch_size]
+            cursor.executemany(insert_query, batch)
+            inserted = min(i + batch_size, total)
+            # Report on stderr at most once a second — console writes
+            # flush synchronously and would slow down the insert loop
+            if time.monotonic() - last_report >= 1.0:
+                last_report = time.monotonic()
+                sys.stderr.write(f"\r   ⬆️  Inserted {inserted}/{total} rows...")
+                sys.stderr.flush()
         conn.commit()
-        inserted = min(i + batch_size, total)
-        print(f"   ⬆️  Inserted {inserted}/{total} rows...", end="\r")
+    except pyodbc.Error:
+        conn.rollback()
+        raise
 
     print(f"\n✅ All {total} rows inserted successfully!")
     cursor.close()
 
 
 def verify_data(conn):
-    """Step 7: Verify the inserted data."""
+    """Step 7: Verify the inserted data (one batch, three result sets —
+    a single server round-trip instead of three)."""
     cursor = conn.cursor()
 
-    # Total count
-    cursor.execute("SELECT COUNT(*) FROM tags")
+    cursor.execute("""
+        SELECT COUNT(*) FROM tags;
+        SELECT TOP 10 * FROM tags;
+        SELECT channel_name, COUNT(*) as tag_count FROM tags
+        GROUP BY channel_name ORDER BY tag_count DESC;
+    """)
+
+    # Result set 1: total count
     total = cursor.fetchone()[0]
     print(f"\n📊 Total rows in 'tags' table: {total}")
 
-    # Show sample data
+    # Result set 2: sample data
+    cursor.nextset()
     print("\n📋 Sample data (first 10 rows):")
     print("-" * 100)
     print(f"{'ID':<6} {'Channel':<15} {'Device':<25} {'Tag Name':<35} {'Address':<10} {'Type':<6} {'Rate'}")
     print("-" * 100)
 
-    cursor.execute("SELECT TOP 10 * FROM tags")
     for row in cursor.fetchall():
         print(f"{row.id:<6} {str(row.channel_name):<15} {str(row.device_name):<25} {str(row.tag_name):<35} {str(row.address):<10} {str(row.data_type):<6} {row.scan_rate}")
 
     print("-" * 100)
 
-    # Count by channel
+    # Result set 3: count by channel
+    cursor.nextset()
     print("\n📊 Rows per channel:")
-    cursor.execute("SELECT channel_name, COUNT(*) as tag_count FROM tags GROUP BY channel_name ORDER BY tag_count DESC")
     for row in cursor.fetchall():
         print(f"   {row.channel_name}: {row.tag_count} tags")
 
@@ -209,11 +280,10 @@ if __name__ == "__main__":
     print("\n🔌 Connecting to SQL Server...")
     conn = connect_to_sql_server(SERVER, DRIVER, "master")
 
-    # Step 4: Create database
-    create_database(conn, DATABASE)
+    # Step 4: Create database and switch to it (no reconnect needed)
+    conn = create_database(conn, DATABASE)
 
-    # Step 5: Reconnect to new database and create table
-    conn = connect_to_sql_server(SERVER, DRIVER, DATABASE)
+    # Step 5: Create table
     create_table(conn)
 
     # Step 6: Insert all rows
@@ -12,9 +12,45 @@ What is Deserialization?
 """
 
 import json
+import mmap
 import os
 import sys
 
+# orjson is a Rust/SIMD JSON parser, ~2-3x faster than the stdlib and
+# lighter on the garbage collector. Optional — we fall back to json.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# ijson parses the file as a STREAM (one channel at a time) instead of
+# loading the whole thing into memory. It's optional — without it we
+# fall back to json.load, which still works but needs RAM for the
+# entire file.
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Compiled extraction loop (see extract_tags_c.pyx). Optional — build
+# it with "cythonize -3 --inplace extract_tags_c.pyx" for a big speedup
+# on the eager (non-streaming) path; without it the Python loop runs.
+try:
+    from extract_tags_c import extract_tags as _extract_tags_c
+except ImportError:
+    _extract_tags_c = None
+
+# JSON key names used in the extraction hot loop, hoisted to module
+# level and interned. These dotted names are NOT auto-interned by
+# CPython (unlike plain identifiers), so without this every dict lookup
+# re-hashes and compares the full string; interned keys can hit the
+# pointer-identity fast path instead.
+KEY_NAME = sys.intern("common.ALLTYPES_NAME")
+KEY_DEVICE_ID = sys.intern("servermain.DEVICE_ID_STRING")
+KEY_ADDRESS = sys.intern("servermain.TAG_ADDRESS")
+KEY_DATA_TYPE = sys.intern("servermain.TAG_DATA_TYPE")
+KEY_SCAN_RATE = sys.intern("servermain.TAG_SCAN_RATE_MILLISECONDS")
+
 
 def read_json_file(file_path):
     """
@@ -28,8 +64,8 @@ def read_json_file(file_path):
 
     How it works:
         1. Checks if the file exists
-        2. Opens the file with utf-8-sig encoding (handles BOM marker)
-        3. json.load() reads the entire file and converts JSON text
+        2. Reads the raw bytes and strips the BOM (Byte Order Mark)
+        3. orjson.loads() (or json.load as fallback) converts JSON text
            into Python objects (dicts, lists, strings, numbers)
     """
     if not os.path.exists(file_path):
@@ -39,9 +75,28 @@ def read_json_file(file_path):
     file_size_mb = os.path.getsize(file_path) / (1024 * 1024)
     print(f"📖 Reading JSON file ({file_size_mb:.1f} MB)...")
 
-    # encoding="utf-8-sig" strips the BOM (Byte Order Mark) if present
-    with open(file_path, "r", encoding="utf-8-sig") as f:
-        data = json.load(f)
+    if orjson is not None:
+        # Memory-map the file instead of f.read(): read() copies the
+        # whole file into a fresh bytes object before parsing even
+        # starts, while mmap lets orjson parse the OS page cache in
+        # place (orjson accepts any buffer object). The memoryview
+        # skips the UTF-8 BOM without copying either.
+        with open(file_path, "rb") as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                view = memoryview(mm)
+                try:
+                    if view[:3] == b"\xef\xbb\xbf":
+                        view = view[3:]
+                    data = orjson.loads(view)
+                finally:
+                    view.release()
+            finally:
+                mm.close()
+    else:
+        # encoding="utf-8-sig" strips the BOM if present
+        with open(file_path, "r", encoding="utf-8-sig") as f:
+            data = json.load(f)
 
     print("✅ JSON deserialized successfully!")
     return data
@@ -71,28 +126,100 @@ def extract_tags(data):
                         ├── servermain.TAG_DATA_TYPE           ← data_type
                         └── servermain.TAG_SCAN_RATE_MILLISECONDS ← scan_rate
     """
+    # Use the compiled extension when it has been built — same walk,
+    # but without CPython's per-iteration interpreter overhead
+    if _extract_tags_c is not None:
+        rows = _extract_tags_c(data)
+        print(f"✅ Extracted {len(rows)} tag rows from JSON (C extension)")
+        return rows
+
     rows = []
 
     channels = data.get("project", {}).get("channels", [])
     print(f"📊 Found {len(channels)} channels in JSON")
 
+    # Hot loop: this runs once per tag (potentially hundreds of
+    # thousands of times), so keep per-iteration interpreter work low —
+    # one rows.extend per device instead of one rows.append per tag.
+    rows_extend = rows.extend
+
     for channel in channels:
-        channel_name = channel.get("common.ALLTYPES_NAME", "")
+        channel_name = channel.get(KEY_NAME, "")
 
         for device in channel.get("devices", []):
-            device_name = device.get("common.ALLTYPES_NAME", "")
-            device_id_string = device.get("servermain.DEVICE_ID_STRING", "")
+            device_name = device.get(KEY_NAME, "")
+            device_id_string = device.get(KEY_DEVICE_ID, "")
 
-            for tag in device.get("tags", []):
-                rows.append((
+            rows_extend(
+                (
                     channel_name,
                     device_name,
                     device_id_string,
-                    tag.get("common.ALLTYPES_NAME"),
-                    tag.get("servermain.TAG_ADDRESS"),
-                    tag.get("servermain.TAG_DATA_TYPE"),
-                    tag.get("servermain.TAG_SCAN_RATE_MILLISECONDS")
-                ))
+                    tag.get(KEY_NAME),
+                    tag.get(KEY_ADDRESS),
+                    tag.get(KEY_DATA_TYPE),
+                    tag.get(KEY_SCAN_RATE)
+                )
+                for tag in device.get("tags", ())
+            )
 
     print(f"✅ Extracted {len(rows)} tag rows from JSON")
     return rows
+
+
+def stream_tags(file_path):
+    """
+    Streams tag rows straight from the JSON file, one at a time.
+
+    Args:
+        file_path (str): Full path to the JSON file
+
+    Returns:
+        generator: Yields one tuple per tag (same shape as extract_tags)
+
+    Why stream?
+        json.load() builds the ENTIRE dict tree in memory before we can
+        extract a single row — for a hundreds-of-MB file that doubles
+        peak memory (raw text + Python objects). ijson instead walks
+        the file incrementally and hands us one channel at a time, so
+        memory stays flat and the first INSERT can start before the
+        file is even fully parsed.
+
+    Falls back to read_json_file + extract_tags when ijson isn't
+    installed (pip install ijson).
+    """
+    if not os.path.exists(file_path):
+        print(f"❌ ERROR: JSON file not found at: {file_path}")
+        sys.exit(1)
+
+    file_size_mb = os.path.getsize(file_path) / (1024 * 1024)
+    print(f"📖 Streaming JSON file ({file_size_mb:.1f} MB)...")
+
+    if ijson is None:
+        print("⚠️  ijson not installed — falling back to in-memory parse")
+        return iter(extract_tags(read_json_file(file_path)))
+
+    return _iter_tags(file_path)
+
+
+def _iter_tags(file_path):
+    """Generator that yields tag rows channel-by-channel via ijson."""
+    with open(file_path, "rb") as f:
+        # 'project.channels.item' = each element of the channels array
+        for channel in ijson.items(f, "project.channels.item"):
+            channel_name = channel.get(KEY_NAME, "")
+
+            for device in channel.get("devices", []):
+                device_name = device.get(KEY_NAME, "")
+                device_id_string = device.get(KEY_DEVICE_ID, "")
+
+                for tag in device.get("tags", ()):
+                    yield (
+                        channel_name,
+                        device_name,
+                        device_id_string,
+                        tag.get(KEY_NAME),
+                        tag.get(KEY_ADDRESS),
+                        tag.get(KEY_DATA_TYPE),
+                        tag.get(KEY_SCAN_RATE)
+                    )
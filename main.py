@@ -15,8 +15,9 @@ import time
 import sys
 
 # Import our custom modules
-from json_reader import read_json_file, extract_tags
-from db_handler import connect, create_database, create_table, insert_rows, verify_data
+from json_reader import stream_tags
+from db_handler import (connect, create_database, create_table, insert_rows,
+                        prepare_bulk_load, finalize_bulk_load, verify_data)
 
 
 # ---- CONFIGURATION ----
@@ -35,31 +36,43 @@ def main():
     print("=" * 60)
 
     # ──────────────────────────────────────────────
-    # PHASE 1: READ JSON (using json_reader module)
+    # PHASE 1: OPEN JSON STREAM (using json_reader module)
     # ──────────────────────────────────────────────
-    print("\n📂 PHASE 1: Reading JSON file...")
-    data = read_json_file(JSON_FILE)       # Deserialize JSON → Python dict
-    rows = extract_tags(data)              # Extract tags → list of tuples
-
-    if len(rows) == 0:
-        print("⚠️  No tags found in JSON file. Nothing to insert.")
-        sys.exit(0)
+    print("\n📂 PHASE 1: Opening JSON file...")
+    rows = stream_tags(JSON_FILE)          # Generator: yields tag rows on demand
 
     # ──────────────────────────────────────────────
     # PHASE 2: DATABASE SETUP (using db_handler module)
     # ──────────────────────────────────────────────
     print("\n🗄️  PHASE 2: Setting up database...")
     conn = connect(SERVER, DRIVER, "master")     # Connect to master first
-    create_database(conn, DATABASE)               # Create ase_config DB
-
-    conn = connect(SERVER, DRIVER, DATABASE)      # Reconnect to ase_config
+    conn = create_database(conn, DATABASE)        # Create ase_config DB and
+                                                  # switch to it (no reconnect)
     create_table(conn)                            # Create tags table
 
     # ──────────────────────────────────────────────
     # PHASE 3: INSERT DATA (using db_handler module)
     # ──────────────────────────────────────────────
-    print(f"\n⬆️  PHASE 3: Inserting {len(rows)} rows...")
-    insert_rows(conn, rows)
+    # The generator is consumed here, so parsing and inserting overlap:
+    # the first batch goes to SQL Server before the file is fully read.
+    print("\n⬆️  PHASE 3: Inserting rows...")
+    previous_recovery = prepare_bulk_load(conn)   # SIMPLE recovery (bcp path only)
+    loaded = False
+    try:
+        total = insert_rows(conn, rows,
+                            connect_args=(SERVER, DRIVER, DATABASE),
+                            clear=False)   # create_table just rebuilt it empty
+        loaded = True
+    finally:
+        # Runs on the error path too: leaving the database in SIMPLE
+        # recovery would break its log-backup chain. The index build
+        # is skipped when the load failed (the table rolled back empty).
+        finalize_bulk_load(conn, previous_recovery, build_index=loaded)
+
+    if total == 0:
+        print("⚠️  No tags found in JSON file. Nothing to insert.")
+        conn.close()
+        sys.exit(0)
 
     # ──────────────────────────────────────────────
     # PHASE 4: VERIFY (using db_handler module)